@@ -5,7 +5,7 @@ a = Analysis(
     ['src/codecat/__main__.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('src/codecat/default_config.json', 'codecat')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
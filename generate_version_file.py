@@ -11,9 +11,15 @@ Usage:
 - Reads the [project] section from pyproject.toml.
 - Writes a file_version_info.txt file in the format expected by PyInstaller.
 - Keeps version and author info in sync with the main project metadata.
+- Caches the rendered file under .build-cache/, keyed by a hash of
+  pyproject.toml and this script, so repeated CI builds skip the TOML
+  parse and render.
 """
 
+import hashlib
 import sys
+from pathlib import Path
+from string import Template
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -23,33 +29,17 @@ else:
     except ImportError:
         sys.exit("Error: tomllib or tomli is required. Please run 'pip install tomli'.")
 
-print("Reading metadata from pyproject.toml...")
-try:
-    with open("pyproject.toml", "rb") as f:
-        pyproject_data = tomllib.load(f)["project"]
-
-    APP_VERSION = pyproject_data["version"]
-    APP_NAME = pyproject_data["name"]
-    APP_AUTHOR = pyproject_data["authors"][0]["name"]
-    APP_DESCRIPTION = pyproject_data["description"]
-
-except (FileNotFoundError, KeyError) as e:
-    sys.exit(f"Error: Could not read required metadata from pyproject.toml. {e}")
-
-# PyInstaller expects a 4-part version tuple (e.g., 1, 2, 3, 0)
-version_parts = APP_VERSION.split(".") + ["0"] * (4 - len(APP_VERSION.split(".")))
-version_tuple_str = ", ".join(version_parts[:4])
-
-VERSION_FILE_PATH = "file_version_info.txt"
-print(f"Generating {VERSION_FILE_PATH} for version {APP_VERSION}...")
+PYPROJECT_PATH = Path("pyproject.toml")
+VERSION_FILE_PATH = Path("file_version_info.txt")
+BUILD_CACHE_DIR = Path(".build-cache")
 
 # Template for the version info file (used by PyInstaller)
-file_content = f"""
+VERSION_INFO_TEMPLATE = Template("""
 # UTF-8
 VSVersionInfo(
   ffi=FixedFileInfo(
-    filevers=({version_tuple_str}),
-    prodvers=({version_tuple_str}),
+    filevers=($version_tuple),
+    prodvers=($version_tuple),
     mask=0x3f,
     flags=0x0,
     OS=0x40004,
@@ -62,23 +52,68 @@ VSVersionInfo(
       [
       StringTable(
         '040904B0',
-        [StringStruct('CompanyName', '{APP_AUTHOR}'),
-        StringStruct('FileDescription', '{APP_DESCRIPTION}'),
-        StringStruct('FileVersion', '{APP_VERSION}'),
-        StringStruct('InternalName', '{APP_NAME}'),
-        StringStruct('LegalCopyright', 'Copyright © 2025 {APP_AUTHOR}'),
-        StringStruct('OriginalFilename', '{APP_NAME}.exe'),
-        StringStruct('ProductName', '{APP_NAME}'),
-        StringStruct('ProductVersion', '{APP_VERSION}')])
+        [StringStruct('CompanyName', '$author'),
+        StringStruct('FileDescription', '$description'),
+        StringStruct('FileVersion', '$version'),
+        StringStruct('InternalName', '$name'),
+        StringStruct('LegalCopyright', 'Copyright © 2025 $author'),
+        StringStruct('OriginalFilename', '$name.exe'),
+        StringStruct('ProductName', '$name'),
+        StringStruct('ProductVersion', '$version')])
       ]),
     VarFileInfo([VarStruct('Translation', [1033, 1200])])
   ]
 )
-"""
+""")
+
+print("Reading metadata from pyproject.toml...")
+try:
+    pyproject_bytes = PYPROJECT_PATH.read_bytes()
+except FileNotFoundError as e:
+    sys.exit(f"Error: Could not read required metadata from pyproject.toml. {e}")
+
+# Reuse a previously rendered file if pyproject.toml is byte-identical.
+# The script's own bytes are part of the key so that template or
+# rendering changes invalidate a persisted cache instead of restoring a
+# stale render.
+hasher = hashlib.blake2b(pyproject_bytes)
+hasher.update(Path(__file__).read_bytes())
+cache_key = hasher.hexdigest()
+cached_version_file = BUILD_CACHE_DIR / f"{cache_key}.txt"
+if cached_version_file.is_file():
+    VERSION_FILE_PATH.write_bytes(cached_version_file.read_bytes())
+    print("Restored file_version_info.txt from build cache.")
+    sys.exit(0)
+
+try:
+    pyproject_data = tomllib.loads(pyproject_bytes.decode("utf-8"))["project"]
+
+    APP_VERSION = pyproject_data["version"]
+    APP_NAME = pyproject_data["name"]
+    APP_AUTHOR = pyproject_data["authors"][0]["name"]
+    APP_DESCRIPTION = pyproject_data["description"]
+
+except KeyError as e:
+    sys.exit(f"Error: Could not read required metadata from pyproject.toml. {e}")
+
+# PyInstaller expects a 4-part version tuple (e.g., 1, 2, 3, 0)
+version_parts = APP_VERSION.split(".") + ["0"] * (4 - len(APP_VERSION.split(".")))
+version_tuple_str = ", ".join(version_parts[:4])
+
+print(f"Generating {VERSION_FILE_PATH} for version {APP_VERSION}...")
+
+file_content = VERSION_INFO_TEMPLATE.substitute(
+    version_tuple=version_tuple_str,
+    version=APP_VERSION,
+    name=APP_NAME,
+    author=APP_AUTHOR,
+    description=APP_DESCRIPTION,
+)
 
 try:
-    with open(VERSION_FILE_PATH, "w", encoding="utf-8") as f:
-        f.write(file_content)
+    VERSION_FILE_PATH.write_text(file_content, encoding="utf-8")
+    BUILD_CACHE_DIR.mkdir(exist_ok=True)
+    cached_version_file.write_text(file_content, encoding="utf-8")
     print("Successfully created file_version_info.txt.")
 except IOError as e:
     sys.exit(f"Error writing to {VERSION_FILE_PATH}: {e}")
@@ -8,29 +8,32 @@ It orchestrates the application's functionality, from configuration
 and file scanning to processing and output generation.
 """
 
-import json
+import os
 import sys
 from collections import Counter
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from contextlib import nullcontext
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 
 import typer
 from rich.console import Console
-from rich.json import JSON
-from rich.panel import Panel
-from rich.table import Table
 from typing_extensions import Annotated
 
+if TYPE_CHECKING:
+    from rich.table import Table
+
 # --- Application Imports ---
+# NOTE: Renderable-heavy rich modules (Table, Panel, JSON) and the web UI are
+# imported lazily inside the functions that use them, so `--version`/`--help`
+# do not pay their import cost. The scanner and processor stay top-level:
+# the process-pool worker entry points must be importable by name.
 from codecat import __version__
-from codecat.config import DEFAULT_CONFIG, load_config
+from codecat.config import DEFAULT_CONFIG, dumps_json, load_config
 from codecat.constants import DEFAULT_CONFIG_FILENAME
 from codecat.file_processor import ProcessedFileData, process_file
-from codecat.file_scanner import scan_project
-from codecat.markdown_generator import generate_markdown
-from codecat.web_ui import start_web_app
+from codecat.file_scanner import iter_project_files, scan_project
+from codecat.markdown_generator import iter_markdown
 
 # --- Initialize Rich Console for output ---
 console = Console(stderr=True, highlight=False)
@@ -100,8 +103,10 @@ ExcludePatterns = Annotated[
 # --- Helper Functions for Rich UI and Output ---
 def _create_summary_table(
     processed_results: list[ProcessedFileData], project_path: Path
-) -> Table:
+) -> "Table":
     """Creates a Rich Table summarizing the results of a scan."""
+    from rich.table import Table
+
     summary = Table(
         title=f"Codecat Scan Summary for '{project_path.name}'",
         show_header=True,
@@ -111,12 +116,19 @@ def _create_summary_table(
     summary.add_column("Count", justify="right")
     summary.add_column("Details")
 
-    status_counts = Counter(p.status for p in processed_results)
-
-    text_files = status_counts.get("text_content", 0)
-    binary_files = status_counts.get("binary_file", 0)
-    read_errors = status_counts.get("read_error", 0)
-    access_errors = status_counts.get("skipped_access_error", 0)
+    # A manual tally over four locals beats Counter here: no per-item hashing
+    # or dict lookup in what is a serial pass over every result.
+    text_files = binary_files = read_errors = access_errors = 0
+    for p in processed_results:
+        status = p.status
+        if status == "text_content":
+            text_files += 1
+        elif status == "binary_file":
+            binary_files += 1
+        elif status == "read_error":
+            read_errors += 1
+        else:
+            access_errors += 1
 
     summary.add_row(
         "[green]Text Files[/green]", str(text_files), "Successfully read and included."
@@ -144,6 +156,8 @@ def _log_initial_info(
     project_path: Path, is_verbose: bool, effective_config: dict
 ) -> None:
     """Prints the initial startup panel and configuration if verbose is enabled."""
+    from rich.panel import Panel
+
     console.print(
         Panel(
             f"🐾 [bold]Codecat v{__version__}[/bold] | "
@@ -152,30 +166,36 @@ def _log_initial_info(
         )
     )
     if is_verbose:
+        from rich.json import JSON
+
         console.print("[bold]Effective Configuration:[/bold]")
-        console.print(JSON(json.dumps(effective_config)))
+        console.print(JSON(dumps_json(effective_config)))
 
 
 def _scan_project_files(
     project_path: Path, effective_config: dict, show_ui: bool
 ) -> list[Path]:
     """Scans the project for files to process, handling UI and errors."""
-    scan_status_text = f"Scanning files in [cyan]'{project_path.name}'[/cyan]..."
-    scan_context = (
-        console.status(scan_status_text, spinner="dots") if show_ui else nullcontext()
-    )
-
-    with scan_context as status:
-        try:
-            # Pass the status object to the scanner so it can update the UI
-            files_to_scan = scan_project(
-                project_path, effective_config, project_path, status_indicator=status
+    try:
+        if show_ui:
+            scan_status_text = (
+                f"Scanning files in [cyan]'{project_path.name}'[/cyan]..."
             )
-        except Exception as e:
-            console.print(f"\n[bold red]Error during file scanning:[/bold red] {e}")
-            if effective_config.get("stop_on_error", False):
-                console.print("[bold red]Exiting due to stop_on_error.[/bold red]")
-            raise typer.Exit(code=1)
+            # Pass the status object to the scanner so it can update the UI
+            with console.status(scan_status_text, spinner="dots") as status:
+                files_to_scan = scan_project(
+                    project_path,
+                    effective_config,
+                    project_path,
+                    status_indicator=status,
+                )
+        else:
+            files_to_scan = scan_project(project_path, effective_config, project_path)
+    except Exception as e:
+        console.print(f"\n[bold red]Error during file scanning:[/bold red] {e}")
+        if effective_config.get("stop_on_error", False):
+            console.print("[bold red]Exiting due to stop_on_error.[/bold red]")
+        raise typer.Exit(code=1)
 
     if not files_to_scan:
         console.print(
@@ -191,64 +211,212 @@ def _scan_project_files(
     return files_to_scan
 
 
+# --- Parallel Processing Helpers ---
+
+# Below this file count, process startup costs outweigh any parallel decode
+# gains, so a thread pool is used instead. Threads also keep small runs (and
+# the test suite) inside a single process.
+PROCESS_POOL_MIN_FILES: int = 32
+
+# Flush buffered verbose log lines after this many results, so Rich rendering
+# does not throttle the result-collection loop on every single file.
+VERBOSE_LOG_BATCH_SIZE: int = 64
+
+# Per-worker state, populated once by _init_worker so that the project path
+# and configuration are not re-pickled for every submitted file.
+_worker_project_path: Optional[Path] = None
+_worker_config: Optional[dict[str, Any]] = None
+
+
+def _init_worker(project_path: Path, effective_config: dict[str, Any]) -> None:
+    """Stores the shared per-task arguments in worker-process globals."""
+    global _worker_project_path, _worker_config
+    _worker_project_path = project_path
+    _worker_config = effective_config
+
+
+def _process_one(
+    file_path: Path,
+) -> tuple[Path, "ProcessedFileData | Exception"]:
+    """
+    Processes a single file using the state installed by `_init_worker`.
+
+    Exceptions are returned rather than raised so that one failing file does
+    not abort the surrounding `executor.map` batch; the caller decides
+    whether to stop based on its `stop_on_error` setting.
+    """
+    assert _worker_project_path is not None and _worker_config is not None
+    try:
+        return file_path, process_file(file_path, _worker_project_path, _worker_config)
+    except Exception as e:
+        return file_path, e
+
+
+def _create_executor(
+    num_files: int,
+    project_path: Path,
+    effective_config: dict,
+    max_workers: Optional[int],
+) -> Executor:
+    """
+    Picks the executor best suited to the workload size.
+
+    Decoding and binary detection are CPU-bound Python work, so large batches
+    use a process pool to scale across cores; small batches stay on threads
+    where startup overhead is negligible.
+    """
+    if num_files >= PROCESS_POOL_MIN_FILES:
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(project_path, effective_config),
+        )
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(project_path, effective_config),
+    )
+
+
+def _report_critical_error(
+    file_path: Path, error: Exception, stop_on_error: bool
+) -> None:
+    """Prints a critical per-file error and exits if stop_on_error is set."""
+    console.print(
+        f"[bold red]Critical error processing {file_path}: {error}[/bold red]"
+    )
+    if stop_on_error:
+        raise typer.Exit(code=1)
+
+
+def _collect_results_quiet(
+    results_iter: "Iterable[tuple[Path, ProcessedFileData | Exception]]",
+    processed_results: list[ProcessedFileData],
+    stop_on_error: bool,
+) -> None:
+    """Collects worker results without any per-result output."""
+    for file_path, outcome in results_iter:
+        if isinstance(outcome, Exception):
+            _report_critical_error(file_path, outcome, stop_on_error)
+            continue
+        processed_results.append(outcome)
+
+
+def _collect_results_verbose(
+    results_iter: "Iterable[tuple[Path, ProcessedFileData | Exception]]",
+    processed_results: list[ProcessedFileData],
+    stop_on_error: bool,
+) -> None:
+    """Collects worker results, logging one line per file in batches."""
+    # Buffer log lines instead of rendering each one immediately; per-result
+    # Rich prints can throttle the collection loop.
+    verbose_log_buf: list[str] = []
+
+    def _flush_verbose_log() -> None:
+        if verbose_log_buf:
+            console.print("\n".join(verbose_log_buf))
+            verbose_log_buf.clear()
+
+    for file_path, outcome in results_iter:
+        if isinstance(outcome, Exception):
+            _flush_verbose_log()
+            _report_critical_error(file_path, outcome, stop_on_error)
+            continue
+        processed_results.append(outcome)
+        if outcome.status == "text_content":
+            verbose_log_buf.append(f"[green]✔ Read:[/] {outcome.relative_path}")
+        elif outcome.status == "binary_file":
+            verbose_log_buf.append(
+                f"[yellow]! Skipped (binary):[/] {outcome.relative_path}"
+            )
+        else:
+            verbose_log_buf.append(
+                f"[red]✖ Error ({outcome.status}):[/] {outcome.relative_path}"
+            )
+        if len(verbose_log_buf) >= VERBOSE_LOG_BATCH_SIZE:
+            _flush_verbose_log()
+    _flush_verbose_log()
+
+
 def _process_files_parallel(
-    files_to_scan: list[Path],
+    files_to_scan: Iterable[Path],
+    total_files: Optional[int],
     project_path: Path,
     effective_config: dict,
     show_ui: bool,
     max_workers: Optional[int],
 ) -> list[ProcessedFileData]:
     """
-    Processes a list of files in parallel, showing a static message and handling errors.
+    Processes files in parallel, showing a static message and handling errors.
+
+    Accepts any iterable so a scan generator can be fed straight into the
+    pool; `total_files` is None when the count is not known up front.
     Returns a sorted list of ProcessedFileData objects.
     """
     processed_results: list[ProcessedFileData] = []
     is_verbose = effective_config.get("verbose", False)
     stop_on_error = effective_config.get("stop_on_error", False)
 
-    if show_ui:
-        console.print(f"Processing {len(files_to_scan)} files...")
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_file = {
-            executor.submit(process_file, f, project_path, effective_config): f
-            for f in files_to_scan
-        }
-        for future in as_completed(future_to_file):
-            try:
-                result = future.result()
-                processed_results.append(result)
-                if is_verbose:
-                    if result.status == "text_content":
-                        console.print(f"[green]✔ Read:[/] {result.relative_path}")
-                    elif result.status == "binary_file":
-                        console.print(
-                            f"[yellow]! Skipped (binary):[/] {result.relative_path}"
-                        )
-                    else:
-                        console.print(
-                            f"[red]✖ Error ({result.status}):[/] {result.relative_path}"
-                        )
-            except Exception as e:
-                file_path = future_to_file[future]
-                console.print(
-                    f"[bold red]Critical error processing {file_path}: {e}[/bold red]"
-                )
-                if stop_on_error:
-                    raise typer.Exit(code=1)
+    if show_ui and total_files is not None:
+        console.print(f"Processing {total_files} files...")
+
+    # Batch tasks through executor.map: one Future per chunk instead of one
+    # per file, which cuts dispatch overhead and memory on large scans.
+    workers = max_workers or (os.cpu_count() or 1)
+    if total_files is None:
+        # Streaming scan: peek at the first batch to size the executor, then
+        # chain it back in front of the remaining files.
+        files_iter = iter(files_to_scan)
+        head = list(islice(files_iter, PROCESS_POOL_MIN_FILES))
+        files_to_scan = chain(head, files_iter)
+        executor_hint = len(head)
+        chunksize = 32
+    else:
+        executor_hint = total_files
+        chunksize = max(1, total_files // (workers * 4))
+
+    with _create_executor(
+        executor_hint, project_path, effective_config, max_workers
+    ) as executor:
+        results_iter = executor.map(_process_one, files_to_scan, chunksize=chunksize)
+        # The UI/silent mode decision is hoisted out of the loop: the quiet
+        # variant is a tight collection loop with no per-result branches.
+        if is_verbose:
+            _collect_results_verbose(results_iter, processed_results, stop_on_error)
+        else:
+            _collect_results_quiet(results_iter, processed_results, stop_on_error)
 
     if show_ui:
         console.print("✔ Processing complete.")
 
-    return sorted(processed_results, key=lambda p: p.relative_path)
+    # executor.map preserves input order, so when the staged path handed us
+    # scan_project's already-sorted list there is nothing left to sort. Only
+    # the streaming scan yields files in traversal order and needs the pass.
+    if total_files is None:
+        # Sort on a plain string key: PurePath comparisons go through
+        # Python-level __lt__ per comparison, strings compare at C level.
+        processed_results.sort(
+            key=lambda p: p.relative_path_posix or p.relative_path.as_posix()
+        )
+    return processed_results
 
 
 def _write_markdown_output(
-    markdown_content: str, output_file_path: Path, silent: bool, num_files: int
+    markdown_chunks: Iterable[str],
+    output_file_path: Path,
+    silent: bool,
+    num_files: int,
 ) -> None:
-    """Writes the final markdown content to a file and prints a success message."""
+    """
+    Streams the markdown chunks to a file and prints a success message.
+
+    Writing chunk by chunk through a large write buffer avoids materializing
+    the whole document (plus its encoded bytes) in memory at once.
+    """
     try:
-        output_file_path.write_text(markdown_content, encoding="utf-8")
+        with output_file_path.open("wb", buffering=1024 * 1024) as f:
+            for chunk in markdown_chunks:
+                f.write(chunk.encode("utf-8"))
         if not silent:
             console.print(
                 f"\n[bold green]✔ Success![/bold green] "
@@ -263,6 +431,29 @@ def _write_markdown_output(
         raise typer.Exit(code=1)
 
 
+def _iter_project_files_checked(
+    project_path: Path, effective_config: dict
+) -> Iterable[Path]:
+    """Wraps the scan generator with the same error handling as the staged path.
+
+    Also deduplicates: the walk yields a symlinked file as its resolved
+    target, so a link and its in-tree target arrive as the same path twice.
+    """
+    try:
+        seen: set = set()
+        for file_path in iter_project_files(
+            project_path, effective_config, project_path
+        ):
+            if file_path not in seen:
+                seen.add(file_path)
+                yield file_path
+    except Exception as e:
+        console.print(f"\n[bold red]Error during file scanning:[/bold red] {e}")
+        if effective_config.get("stop_on_error", False):
+            console.print("[bold red]Exiting due to stop_on_error.[/bold red]")
+        raise typer.Exit(code=1)
+
+
 def _orchestrate_scan(
     project_path: Path,
     effective_config: dict,
@@ -272,17 +463,36 @@ def _orchestrate_scan(
     """
     Handles the shared logic of scanning and processing files for any command.
 
-    This function consolidates the workflow of scanning a project directory
-    based on the effective configuration and then processing the discovered
-    files in parallel.
+    When the spinner or verbose scan summary is shown, the scan runs to
+    completion first so the file count is known up front. Otherwise the scan
+    generator is fed straight into the worker pool, overlapping directory
+    traversal with file processing.
 
     Returns:
         A list of ProcessedFileData objects containing the results.
     """
-    files_to_scan = _scan_project_files(project_path, effective_config, show_ui)
+    is_verbose = effective_config.get("verbose", False)
+
+    if show_ui or is_verbose:
+        files_to_scan: Iterable[Path] = _scan_project_files(
+            project_path, effective_config, show_ui
+        )
+        total_files: Optional[int] = len(files_to_scan)  # type: ignore[arg-type]
+    else:
+        files_to_scan = _iter_project_files_checked(project_path, effective_config)
+        total_files = None
+
     processed_results = _process_files_parallel(
-        files_to_scan, project_path, effective_config, show_ui, max_workers
+        files_to_scan, total_files, project_path, effective_config, show_ui, max_workers
     )
+
+    if total_files is None and not processed_results:
+        console.print(
+            "\n[yellow]No files found to aggregate based on the "
+            "current configuration.[/yellow]"
+        )
+        raise typer.Exit()
+
     return processed_results
 
 
@@ -337,7 +547,7 @@ def run(
         Optional[int],
         typer.Option(
             "--max-workers",
-            help="Set the max number of parallel threads. Defaults to an optimal number based on your system's cores.",  # noqa: E501
+            help="Set the max number of parallel workers. Defaults to an optimal number based on your system's cores.",  # noqa: E501
         ),
     ] = None,
 ):
@@ -378,13 +588,13 @@ def run(
         )
         raise typer.Exit()
 
-    markdown_content = generate_markdown(
-        processed_results, project_path, effective_config
+    markdown_chunks = iter_markdown(
+        processed_results, project_path, effective_config, release_content=True
     )
     output_file_path = project_path / effective_config["output_file"]
 
     _write_markdown_output(
-        markdown_content, output_file_path, silent, len(processed_results)
+        markdown_chunks, output_file_path, silent, len(processed_results)
     )
 
 
@@ -398,13 +608,16 @@ def stats(
         Optional[int],
         typer.Option(
             "--max-workers",
-            help="Set the max number of parallel threads. Defaults to an optimal number based on your system's cores.",  # noqa: E501
+            help="Set the max number of parallel workers. Defaults to an optimal number based on your system's cores.",  # noqa: E501
         ),
     ] = None,
 ):
     """
     Scans the project and displays file count and line count statistics.
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
     is_testing = "pytest" in sys.modules
     show_ui = not is_testing
 
@@ -430,7 +643,6 @@ def stats(
         project_path, effective_config, show_ui, max_workers
     )
 
-    lang_map = effective_config.get("language_hints", {})
     lang_counts = Counter()
     line_counts = Counter()
     total_lines = 0
@@ -443,9 +655,15 @@ def stats(
     for file_data in text_files:
         if file_data.content is None:
             continue
-        lang = lang_map.get(file_data.path.suffix.lower(), "text")
+        # The language hint is resolved in the workers during processing.
+        lang = file_data.language or "text"
         lang_counts[lang] += 1
-        num_lines = len(file_data.content.splitlines())
+        # str.count is a tight C loop; splitlines() would allocate a list of
+        # every line just to take its length.
+        content = file_data.content
+        num_lines = content.count("\n") + (
+            1 if content and not content.endswith("\n") else 0
+        )
         line_counts[lang] += num_lines
         total_lines += num_lines
 
@@ -457,10 +675,14 @@ def stats(
     stats_table.add_column("Lines of Code", justify="right", style="yellow")
     stats_table.add_column("% of Lines", justify="right", style="dim")
 
+    # Hoist the zero-guard and division out of the loop; each row is then a
+    # single multiply.
+    percent_scale = 100.0 / total_lines if total_lines > 0 else 0.0
     for lang, count in lang_counts.most_common():
         lines = line_counts[lang]
-        percentage = (lines / total_lines * 100) if total_lines > 0 else 0
-        stats_table.add_row(lang, str(count), f"{lines:,}", f"{percentage:.1f}%")
+        stats_table.add_row(
+            lang, str(count), f"{lines:,}", f"{lines * percent_scale:.1f}%"
+        )
 
     stats_table.add_section()
     stats_table.add_row(
@@ -530,7 +752,7 @@ def generate_config(
 
     try:
         config_file_path.write_text(
-            json.dumps(DEFAULT_CONFIG, indent=4), encoding="utf-8"
+            dumps_json(DEFAULT_CONFIG, pretty=True), encoding="utf-8"
         )
         console.print(
             "Successfully generated config file: "
@@ -559,6 +781,10 @@ def web(
     """
     Launch the optional Codecat Web Interface.
     """
+    from rich.panel import Panel
+
+    from codecat.web_ui import start_web_app
+
     console.print(
         Panel(
             f"🌐 [bold]Starting Codecat Web Interface[/bold]\n"
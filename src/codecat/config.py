@@ -8,329 +8,100 @@ and merges them with any command-line arguments to produce the final,
 effective configuration used by the application.
 """
 
-import copy
+import functools
 import json
 import logging
+import os
+import sys
+from importlib import resources
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 # Import constants for default config file names.
-from codecat.constants import DEFAULT_CONFIG_FILENAME, DEFAULT_OUTPUT_FILENAME
+from codecat.constants import DEFAULT_CONFIG_FILENAME
 
-# Default configuration for Codecat.
+# Use the C-accelerated orjson when available (installed via the `fast`
+# extra), falling back to the stdlib encoder otherwise.
+try:
+    import orjson
+
+    def dumps_json(obj: Any, pretty: bool = False) -> str:
+        """Serializes an object to a JSON string, indented if `pretty` is set.
+
+        The pretty path (generated config files, verbose dumps) uses the
+        stdlib encoder so the output is byte-identical whether or not the
+        `fast` extra is installed — orjson only offers 2-space indents,
+        which would disagree with the shipped 4-space default config.
+        """
+        if pretty:
+            return json.dumps(obj, indent=4)
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads_json(data: "str | bytes") -> Any:
+        """Parses a JSON document from a string or bytes."""
+        return orjson.loads(data)
+
+except ImportError:
+
+    def dumps_json(obj: Any, pretty: bool = False) -> str:
+        """Serializes an object to a JSON string, indented if `pretty` is set."""
+        return json.dumps(obj, indent=4 if pretty else None)
+
+    def loads_json(data: "str | bytes") -> Any:
+        """Parses a JSON document from a string or bytes."""
+        return json.loads(data)
+
+
+# Default configuration for Codecat, shipped as package data so the module
+# imports a small loader instead of byte-compiling a ~300-line dict literal.
 # Keys starting with "_" are treated as comments and ignored by the parser.
-DEFAULT_CONFIG: dict[str, Any] = {
-    "_comment_main": "This is the default configuration for Codecat. You can customize it for your project.",  # noqa: E501
-    "output_file": DEFAULT_OUTPUT_FILENAME,
-    "_comment_patterns": "Use glob patterns (like *.py, src/*) to control which files are included or excluded.",  # noqa: E501
-    "include_patterns": [
-        "*.py",
-        "*.pyw",
-        "*.pyi",
-        "*.js",
-        "*.jsx",
-        "*.ts",
-        "*.tsx",
-        "*.mjs",
-        "*.cjs",
-        "*.html",
-        "*.htm",
-        "*.css",
-        "*.scss",
-        "*.sass",
-        "*.less",
-        "*.vue",
-        "*.svelte",
-        "*.java",
-        "*.kt",
-        "*.kts",
-        "*.scala",
-        "*.groovy",
-        "*.c",
-        "*.cpp",
-        "*.cc",
-        "*.cxx",
-        "*.h",
-        "*.hpp",
-        "*.hh",
-        "*.hxx",
-        "*.cs",
-        "*.csx",
-        "*.vb",
-        "*.go",
-        "*.rs",
-        "*.zig",
-        "*.sh",
-        "*.bash",
-        "*.zsh",
-        "*.fish",
-        "*.ps1",
-        "*.bat",
-        "*.cmd",
-        "*.rb",
-        "*.rake",
-        "Rakefile",
-        "Gemfile",
-        "*.php",
-        "*.phtml",
-        "*.sql",
-        "*.pgsql",
-        "*.mysql",
-        "*.json",
-        "*.jsonc",
-        "*.json5",
-        "*.yaml",
-        "*.yml",
-        "*.toml",
-        "*.ini",
-        "*.cfg",
-        "*.conf",
-        "*.xml",
-        "*.env",
-        ".env.example",
-        "*.md",
-        "*.markdown",
-        "*.rst",
-        "*.txt",
-        "*.swift",
-        "*.dart",
-        "*.lua",
-        "*.r",
-        "*.R",
-        "*.m",
-        "*.pl",
-        "*.ex",
-        "*.exs",
-        "Dockerfile",
-        "Dockerfile.*",
-        "docker-compose.yml",
-        "docker-compose.yaml",
-        ".dockerignore",
-        "Makefile",
-        "CMakeLists.txt",
-        ".gitignore",
-        ".gitattributes",
-        ".editorconfig",
-        ".eslintrc",
-        ".eslintrc.js",
-        ".eslintrc.json",
-        ".prettierrc",
-        ".flake8",
-        "pyproject.toml",
-        "setup.py",
-        "setup.cfg",
-        "requirements.txt",
-        "package.json",
-        "tsconfig.json",
-        "cargo.toml",
-        "go.mod",
-    ],
-    "exclude_patterns": [
-        "*.pyc",
-        "*.pyo",
-        "*.pyd",
-        "*.so",
-        "*.egg",
-        "*.whl",
-        "*.min.js",
-        "*.min.css",
-        "*.bundle.js",
-        "*.chunk.js",
-        "*.map",
-        "npm-debug.log*",
-        "yarn-debug.log*",
-        "yarn-error.log*",
-        "*.log",
-        "*.o",
-        "*.a",
-        "*.lib",
-        "*.dll",
-        "*.exe",
-        "*.out",
-        "*.class",
-        "*.jar",
-        "*.war",
-        "*.tmp",
-        "*.temp",
-        "*.bak",
-        "*.swp",
-        "*.swo",
-        "*.db",
-        "*.sqlite",
-        "*.sqlite3",
-        "*.cache",
-        "*.com",
-        "*.dylib",
-    ],
-    "_comment_dirs": "List specific directory names to exclude entirely from the scan.",
-    "exclude_dirs": [
-        ".git",
-        ".hg",
-        ".svn",
-        ".bzr",
-        ".vscode",
-        ".idea",
-        ".vs",
-        ".fleet",
-        "__pycache__",
-        ".pytest_cache",
-        ".tox",
-        ".mypy_cache",
-        ".pytype",
-        ".ruff_cache",
-        "venv",
-        ".venv",
-        "env",
-        "ENV",
-        "node_modules",
-        ".npm",
-        ".yarn",
-        ".pnp",
-        ".next",
-        ".nuxt",
-        ".output",
-        ".cache",
-        "build",
-        "dist",
-        "out",
-        "target",
-        "bin",
-        "obj",
-        "pkg",
-        "docs",
-        "docs/_build",
-        "site",
-        "_site",
-        ".docusaurus",
-        "tests",
-        "test",
-        "htmlcov",
-        "coverage",
-        ".nyc_output",
-        "vendor",
-        "bower_components",
-        "android/build",
-        "ios/build",
-        ".expo",
-        ".gradle",
-        "tmp",
-        "temp",
-        "logs",
-    ],
-    "_comment_files": "List specific, exact file names to exclude.",
-    "exclude_files": [
-        ".codecat_config.json",
-        "codecat_output.md",
-        "package-lock.json",
-        "yarn.lock",
-        "pnpm-lock.yaml",
-        ".DS_Store",
-        "Thumbs.db",
-        "desktop.ini",
-        ".coverage",
-        "coverage.xml",
-    ],
-    "_comment_settings": "General application settings.",
-    "max_file_size_kb": 1024,
-    "stop_on_error": False,
-    "generate_header": True,
-    "_comment_languages": "Map file extensions to language hints for Markdown code blocks.",  # noqa: E501
-    "language_hints": {
-        ".py": "python",
-        ".pyw": "python",
-        ".pyi": "python",
-        ".js": "javascript",
-        ".jsx": "javascript",
-        ".mjs": "javascript",
-        ".cjs": "javascript",
-        ".ts": "typescript",
-        ".tsx": "typescript",
-        ".html": "html",
-        ".htm": "html",
-        ".css": "css",
-        ".scss": "scss",
-        ".sass": "scss",
-        ".less": "less",
-        ".vue": "vue",
-        ".svelte": "svelte",
-        ".java": "java",
-        ".kt": "kotlin",
-        ".kts": "kotlin",
-        ".scala": "scala",
-        ".groovy": "groovy",
-        ".c": "c",
-        ".cpp": "cpp",
-        ".cc": "cpp",
-        ".cxx": "cpp",
-        ".h": "c",
-        ".hpp": "cpp",
-        ".hh": "cpp",
-        ".hxx": "cpp",
-        ".cs": "csharp",
-        ".csx": "csharp",
-        ".vb": "vb",
-        ".go": "go",
-        ".rs": "rust",
-        ".zig": "zig",
-        ".sh": "bash",
-        ".bash": "bash",
-        ".zsh": "bash",
-        ".fish": "fish",
-        ".ps1": "powershell",
-        ".bat": "batch",
-        ".cmd": "batch",
-        ".rb": "ruby",
-        ".rake": "ruby",
-        "rakefile": "ruby",
-        "gemfile": "ruby",
-        ".php": "php",
-        ".phtml": "php",
-        ".sql": "sql",
-        ".pgsql": "sql",
-        ".mysql": "sql",
-        ".json": "json",
-        ".jsonc": "jsonc",
-        ".json5": "json5",
-        ".yaml": "yaml",
-        ".yml": "yaml",
-        ".toml": "toml",
-        ".ini": "ini",
-        ".cfg": "ini",
-        ".conf": "ini",
-        ".xml": "xml",
-        ".env": "bash",
-        ".md": "markdown",
-        ".markdown": "markdown",
-        ".rst": "restructuredtext",
-        ".txt": "text",
-        ".swift": "swift",
-        ".dart": "dart",
-        ".lua": "lua",
-        ".r": "r",
-        ".m": "objectivec",
-        ".pl": "perl",
-        ".ex": "elixir",
-        ".exs": "elixir",
-        "dockerfile": "dockerfile",
-        ".dockerignore": "text",
-        "makefile": "makefile",
-        "cmakelists.txt": "cmake",
-        ".gitignore": "text",
-        ".gitattributes": "text",
-        ".editorconfig": "ini",
-        ".eslintrc": "json",
-        ".prettierrc": "json",
-        ".flake8": "ini",
-        "pyproject.toml": "toml",
-        "setup.py": "python",
-        "setup.cfg": "ini",
-        "requirements.txt": "text",
-        "package.json": "json",
-        "tsconfig.json": "json",
-        "cargo.toml": "toml",
-        "go.mod": "go",
-    },
+DEFAULT_CONFIG: dict[str, Any] = loads_json(
+    resources.files("codecat").joinpath("default_config.json").read_bytes()
+)
+
+# Zero-copy read-only view for callers (tests, mostly) that only consume
+# the defaults and would otherwise copy the dict just to avoid aliasing.
+# Not serializable by json/orjson — copy before dumping or mutating.
+DEFAULT_CONFIG_RO: Mapping[str, Any] = MappingProxyType(DEFAULT_CONFIG)
+
+# Interned copy of the default language hints, built once and shared by
+# every config that has no user-supplied hints. Downstream code only ever
+# reads this mapping; a fresh dict is cloned off it when user hints need
+# to be merged in. (A MappingProxyType would be safer still, but the
+# effective config gets dumped as JSON in verbose mode, and neither json
+# nor orjson serializes proxies.)
+_DEFAULT_HINTS: dict[str, str] = {
+    sys.intern(k): sys.intern(v) for k, v in DEFAULT_CONFIG["language_hints"].items()
+}
+
+# Pre-stripped template for building effective configs. Comment keys are
+# removed once here, so `load_config` can start from a cheap shallow copy
+# instead of deep-copying the whole ~150-entry structure on every call.
+# List values are only ever replaced wholesale, never mutated in place,
+# so sharing them is safe.
+_DEFAULT_TEMPLATE: dict[str, Any] = {
+    k: v for k, v in DEFAULT_CONFIG.items() if not k.startswith("_")
 }
+_DEFAULT_TEMPLATE["language_hints"] = _DEFAULT_HINTS
+
+
+@functools.lru_cache(maxsize=16)
+def _read_config_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Reads and parses a JSON config file, cached by path, modification time,
+    and size.
+
+    The `mtime_ns` and `size` arguments are part of the cache key, so
+    editing the file creates a new entry and stale results are never
+    served, even on filesystems with coarse mtime resolution.
+    """
+    return loads_json(Path(path_str).read_bytes())
+
+
+def clear_config_cache() -> None:
+    """Clears the cached config file reads (useful in tests)."""
+    _read_config_cached.cache_clear()
 
 
 def _load_user_config_from_file(
@@ -339,18 +110,22 @@ def _load_user_config_from_file(
     """
     Loads and parses a user-defined JSON configuration file.
 
+    Repeated reads of an unchanged file (e.g. `stats` followed by `run` in
+    the same process) are served from an in-memory cache keyed on the
+    file's modification time.
+
     Returns a tuple of (user_config_dict, loaded_successfully).
     If the file is missing or invalid, returns (None, False).
     """
     if config_path.exists() and config_path.is_file():
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                # Remove comment keys before parsing.
-                user_data = json.load(f)
-                user_config = {
-                    k: v for k, v in user_data.items() if not k.startswith("_")
-                }
-                return user_config, True
+            st = os.stat(config_path)
+            user_data = _read_config_cached(
+                str(config_path), st.st_mtime_ns, st.st_size
+            )
+            # Remove comment keys before parsing.
+            user_config = {k: v for k, v in user_data.items() if not k.startswith("_")}
+            return user_config, True
         except (json.JSONDecodeError, IOError) as e:
             logging.warning(
                 "Notice: Could not load or parse config '%s'. Error: %s.",
@@ -396,7 +171,7 @@ def load_config(
 
     Returns a tuple of (final_config_dict, user_config_loaded, config_path_used).
     """
-    effective_config = copy.deepcopy(DEFAULT_CONFIG)
+    effective_config = dict(_DEFAULT_TEMPLATE)
 
     # Determine which config file to load (CLI override or default location).
     actual_config_path_to_load = (
@@ -411,7 +186,19 @@ def load_config(
     if user_config_loaded and user_config_data:
         user_hints = user_config_data.pop("language_hints", None)
         if isinstance(user_hints, dict):
-            effective_config["language_hints"].update(user_hints)
+            # Clone the shared defaults only now that there is something to
+            # merge, interning user-supplied labels so downstream dict and
+            # Counter operations can use identity comparisons like the
+            # interned defaults. Only strings can be interned; malformed
+            # hint values pass through unchanged rather than crashing here.
+            merged_hints = dict(_DEFAULT_HINTS)
+            merged_hints.update(
+                {
+                    k: sys.intern(v) if isinstance(v, str) else v
+                    for k, v in user_hints.items()
+                }
+            )
+            effective_config["language_hints"] = merged_hints
 
         for key, value in user_config_data.items():
             if key in effective_config:
@@ -426,7 +213,6 @@ def load_config(
         no_header_override,
     )
 
-    # Remove internal comment keys before returning config to the app.
-    final_config = {k: v for k, v in effective_config.items() if not k.startswith("_")}
-
-    return final_config, user_config_loaded, actual_config_path_to_load
+    # The template was built without comment keys, so the config is
+    # already clean for the app.
+    return effective_config, user_config_loaded, actual_config_path_to_load
@@ -8,18 +8,35 @@ a text or binary file, and handling any read or decoding errors. It is
 designed to be called from a worker thread.
 """
 
+import mmap
+import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal, Optional
+from typing import Any, Final, Literal, Optional
 
 FileStatus = Literal[
     "text_content", "binary_file", "read_error", "skipped_access_error"
 ]
 
+# Interned status constants: statuses are compared and counted constantly
+# downstream, and interned strings let dict lookups and == checks take the
+# identity fast path.
+STATUS_TEXT_CONTENT: FileStatus = sys.intern("text_content")  # type: ignore[assignment]
+STATUS_BINARY_FILE: FileStatus = sys.intern("binary_file")  # type: ignore[assignment]
+STATUS_READ_ERROR: FileStatus = sys.intern("read_error")  # type: ignore[assignment]
+STATUS_SKIPPED_ACCESS_ERROR: FileStatus = sys.intern(
+    "skipped_access_error"
+)  # type: ignore[assignment]
 
-@dataclass
+
+@dataclass(slots=True)
 class ProcessedFileData:
-    """A simple data structure to hold the result of processing a single file."""
+    """A simple data structure to hold the result of processing a single file.
+
+    Slotted to drop the per-instance ``__dict__``: large scans hold one of
+    these per file, so the leaner layout and faster attribute access add up.
+    """
 
     path: Path
     relative_path: Path
@@ -27,26 +44,81 @@ class ProcessedFileData:
     content: Optional[str] = None
     error_message: Optional[str] = None
     encoding_used: Optional[str] = None
+    language: Optional[str] = None
+    # Forward-slash form of relative_path, precomputed by process_file so
+    # renderers and sorters don't redo the conversion per file. Empty for
+    # results built elsewhere; use `relative_path_posix or
+    # relative_path.as_posix()` when consuming.
+    relative_path_posix: str = ""
 
 
 # --- Constants ---
-TEXT_ENCODINGS_TO_TRY: list[str] = ["utf-8", "cp1252"]
-BINARY_DETECTION_CHUNK_SIZE: int = 4096
-NULL_BYTE_THRESHOLD_PERCENT: float = 10.0
+# A tuple iterates faster than a list, and interned encoding names make
+# the codec-lookup comparisons pointer checks.
+TEXT_ENCODINGS_TO_TRY: Final[tuple[str, ...]] = (
+    sys.intern("utf-8"),
+    sys.intern("cp1252"),
+)
+BINARY_DETECTION_CHUNK_SIZE: Final[int] = 4096
+NULL_BYTE_THRESHOLD_PERCENT: Final[float] = 10.0
+# Below this size a plain read() beats mmap's setup cost.
+MMAP_MIN_SIZE_BYTES: Final[int] = 64 * 1024
 
 
 # --- Helper Functions ---
 
 
+def _resolve_language(file_path: Path, config: dict[str, Any]) -> str:
+    """
+    Resolves the language hint for a file from the configured hint map.
+
+    Exact, case-insensitive filename matches (e.g. "Dockerfile") take
+    precedence over extension matches. Computed here, inside the worker, so
+    the main thread never has to make a serial pass over the results.
+    """
+    lang_map = config.get("language_hints", {})
+    by_name = lang_map.get(file_path.name.lower())
+    if by_name is not None:
+        return by_name
+    return lang_map.get(file_path.suffix.lower(), "text")
+
+
 def _is_likely_binary_by_nulls(chunk: bytes) -> bool:
     """
     Checks if a chunk of bytes has a high percentage of null bytes,
     which is a strong indicator of a binary file.
     """
-    if not chunk:
+    n = len(chunk)
+    if n == 0:
         return False
-    null_bytes = chunk.count(b"\x00")
-    return (null_bytes / len(chunk)) * 100 > NULL_BYTE_THRESHOLD_PERCENT
+    # Obvious binaries trip the threshold within the first 512 bytes, so
+    # check that slice first and skip scanning the rest of the chunk. The
+    # slice (and its copy) is only taken when there is more beyond it.
+    if n > 512:
+        head = chunk[:512]
+        if head.count(b"\x00") * 100 > len(head) * NULL_BYTE_THRESHOLD_PERCENT:
+            return True
+    # Cross-multiplied form of (nulls / len) * 100 > threshold, avoiding
+    # the float division.
+    return chunk.count(b"\x00") * 100 > n * NULL_BYTE_THRESHOLD_PERCENT
+
+
+def _decode_utf16(
+    file_bytes: bytes,
+) -> tuple[Optional[str], Optional[str], Optional[UnicodeDecodeError]]:
+    """
+    Decodes UTF-16 BOM-marked bytes, normalizing line endings to LF.
+
+    UTF-16 must be decoded before any newline normalization because its
+    code units are two bytes wide.
+    """
+    try:
+        decoded_content = file_bytes.decode("utf-16")
+    except UnicodeDecodeError as e:
+        return None, None, e
+    if "\r" in decoded_content:
+        decoded_content = decoded_content.replace("\r\n", "\n").replace("\r", "\n")
+    return decoded_content, "utf-16", None
 
 
 def _try_decode_bytes(
@@ -60,14 +132,39 @@ def _try_decode_bytes(
         A tuple of (content, encoding, None) on success, or
         (None, None, last_decode_error) on failure.
     """
+    # BOM sniffing: a single startswith memcmp selects the codec outright,
+    # skipping the fallback attempts.
+    encoding_label = "utf-8"
+    if file_bytes.startswith(b"\xef\xbb\xbf"):
+        file_bytes = file_bytes[3:]
+        encoding_label = "utf-8-sig"
+    elif file_bytes.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return _decode_utf16(file_bytes)
+
+    # Normalize line endings (\r\n, \r) to \n once at the bytes level:
+    # '\r' is 0x0D in every encoding we try and never appears inside a
+    # UTF-8 multi-byte sequence, and bytes.replace is a C-level scan that
+    # skips the old decode->splitlines->join round-trip. The containment
+    # check keeps Unix-authored files (the common case) copy-free.
+    if b"\r" in file_bytes:
+        file_bytes = file_bytes.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+    # Fast path: most source files are pure ASCII, which is valid UTF-8,
+    # and bytes.isascii() is a single C-level scan.
+    if file_bytes.isascii():
+        return file_bytes.decode("ascii"), encoding_label, None
+
+    # A UTF-8 BOM promises UTF-8; don't fall back to cp1252 mojibake.
+    if encoding_label == "utf-8-sig":
+        try:
+            return file_bytes.decode("utf-8", errors="strict"), encoding_label, None
+        except UnicodeDecodeError as e:
+            return None, None, e
+
     last_decode_error: Optional[UnicodeDecodeError] = None
     for enc in TEXT_ENCODINGS_TO_TRY:
         try:
-            decoded_content = file_bytes.decode(enc, errors="strict")
-            # Normalize all line endings (\r\n, \r, \n) to a single \n.
-            # This prevents issues when writing the final markdown file.
-            normalized_content = "\n".join(decoded_content.splitlines())
-            return normalized_content, enc, None
+            return file_bytes.decode(enc, errors="strict"), enc, None
         except UnicodeDecodeError as e:
             last_decode_error = e
     return None, None, last_decode_error
@@ -77,11 +174,10 @@ def _handle_decode_failure(
     file_path: Path,
     relative_p: Path,
     decode_error: Optional[UnicodeDecodeError],
-    config: dict[str, Any],
+    stop_on_error: bool,
+    relative_posix: str = "",
 ) -> ProcessedFileData:
     """Creates the ProcessedFileData for a file that failed all decoding attempts."""
-    stop_on_error = config.get("stop_on_error", False)
-
     if stop_on_error and decode_error:
         raise decode_error
 
@@ -95,8 +191,9 @@ def _handle_decode_failure(
     return ProcessedFileData(
         path=file_path,
         relative_path=relative_p,
-        status="read_error",
+        status=STATUS_READ_ERROR,
         error_message=error_message,
+        relative_path_posix=relative_posix,
     )
 
 
@@ -118,14 +215,57 @@ def process_file(
     """
     stop_on_error = config.get("stop_on_error", False)
 
-    try:
-        relative_p = file_path.relative_to(cli_project_path)
-    except ValueError:  # pragma: no cover
-        relative_p = Path(file_path.name)
+    # A C-level prefix strip replaces Path.relative_to's per-component
+    # walk; str(Path) is cached on the instance, so the prefix costs one
+    # concatenation per call against the long-lived project path.
+    path_str = str(file_path)
+    prefix = str(cli_project_path)
+    if not prefix.endswith(os.sep):
+        prefix += os.sep
+    if path_str.startswith(prefix):
+        rel_str = path_str[len(prefix) :]
+    else:  # pragma: no cover
+        rel_str = file_path.name
+    relative_p = Path(rel_str)
+    rel_posix = rel_str if os.sep == "/" else rel_str.replace(os.sep, "/")
+
+    # Files whose extension (or exact name) carries a language hint are
+    # known text formats; the null-byte sniff is pure overhead for them.
+    lang_map = config.get("language_hints", {})
+    known_text = (
+        file_path.suffix.lower() in lang_map or file_path.name.lower() in lang_map
+    )
 
-    # 1. Read file bytes, handling OS errors
+    # 1. Read file bytes, handling OS errors. Large files are memory-mapped
+    # so that a binary verdict costs a single page of I/O instead of reading
+    # and allocating the whole file only to discard it.
     try:
-        file_bytes = file_path.read_bytes()
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if not known_text and _is_likely_binary_by_nulls(
+                        mm[:BINARY_DETECTION_CHUNK_SIZE]
+                    ):
+                        return ProcessedFileData(
+                            path=file_path,
+                            relative_path=relative_p,
+                            status=STATUS_BINARY_FILE,
+                            relative_path_posix=rel_posix,
+                        )
+                    file_bytes = bytes(mm)
+            else:
+                # Probe just the detection chunk first, so a small binary
+                # file costs one 4 KiB read instead of its full size.
+                head = f.read(BINARY_DETECTION_CHUNK_SIZE)
+                if not known_text and _is_likely_binary_by_nulls(head):
+                    return ProcessedFileData(
+                        path=file_path,
+                        relative_path=relative_p,
+                        status=STATUS_BINARY_FILE,
+                        relative_path_posix=rel_posix,
+                    )
+                rest = f.read()
+                file_bytes = head + rest if rest else head
     except OSError as e:
         err_msg = f"OS error accessing file: {type(e).__name__}: {e}"
         if stop_on_error:
@@ -133,8 +273,9 @@ def process_file(
         return ProcessedFileData(
             path=file_path,
             relative_path=relative_p,
-            status="skipped_access_error",
+            status=STATUS_SKIPPED_ACCESS_ERROR,
             error_message=err_msg,
+            relative_path_posix=rel_posix,
         )
 
     # 2. Handle empty file
@@ -142,28 +283,29 @@ def process_file(
         return ProcessedFileData(
             path=file_path,
             relative_path=relative_p,
-            status="text_content",
+            status=STATUS_TEXT_CONTENT,
             content="",
             encoding_used=TEXT_ENCODINGS_TO_TRY[0],
+            language=_resolve_language(file_path, config),
+            relative_path_posix=rel_posix,
         )
 
-    # 3. Strong binary check
-    if _is_likely_binary_by_nulls(file_bytes[:BINARY_DETECTION_CHUNK_SIZE]):
-        return ProcessedFileData(
-            path=file_path, relative_path=relative_p, status="binary_file"
-        )
-
-    # 4. Attempt to decode as text
+    # 3. Attempt to decode as text (the binary check already ran against
+    # the head of the file on whichever read path was taken)
     content_str, encoding_used, decode_error = _try_decode_bytes(file_bytes)
 
     if content_str is not None and encoding_used is not None:
         return ProcessedFileData(
             path=file_path,
             relative_path=relative_p,
-            status="text_content",
+            status=STATUS_TEXT_CONTENT,
             content=content_str,
             encoding_used=encoding_used,
+            language=_resolve_language(file_path, config),
+            relative_path_posix=rel_posix,
         )
 
-    # 5. Handle decode failure
-    return _handle_decode_failure(file_path, relative_p, decode_error, config)
+    # 4. Handle decode failure
+    return _handle_decode_failure(
+        file_path, relative_p, decode_error, stop_on_error, rel_posix
+    )
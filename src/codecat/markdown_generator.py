@@ -8,8 +8,9 @@ single, well-structured Markdown document, complete with headers,
 fenced code blocks, and error notices.
 """
 
+import re
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Iterator, List, Mapping
 
 # Import the data structure representing processed file results.
 from codecat.file_processor import ProcessedFileData
@@ -21,77 +22,132 @@ def _get_language_hint(file_path: Path, lang_map: dict[str, str]) -> str:
     name or extension, falling back to "text" if no specific hint is found.
     """
     # Check for exact, case-insensitive filename matches first (e.g., "Dockerfile")
-    if file_path.name.lower() in lang_map:
-        return lang_map[file_path.name.lower()]
+    hint = lang_map.get(file_path.name.lower())
+    if hint is not None:
+        return hint
     # Then check for extension matches
     return lang_map.get(file_path.suffix.lower(), "text")
 
 
+_BACKTICK_RUN_RE = re.compile(r"`+")
+
+
 def _get_dynamic_fence(content: str) -> str:
     """
     Determines the appropriate backtick fence length for the content.
 
-    This function starts with a standard 3-backtick fence and increases the
-    length until it finds a sequence not present in the content. This ensures
-    that code containing triple backticks can be safely embedded.
+    The fence must be one backtick longer than the longest backtick run in
+    the content (minimum 3) so that code containing triple backticks can be
+    safely embedded. A substring check handles the common no-long-run case
+    in one C-level scan; otherwise a single regex pass finds the longest
+    run instead of rescanning the content per candidate length.
     """
-    fence_len = 3
-    while "`" * fence_len in content:
-        fence_len += 1
-    return "`" * fence_len
+    if "```" not in content:
+        return "```"
+    longest = max(m.end() - m.start() for m in _BACKTICK_RUN_RE.finditer(content))
+    return "`" * (longest + 1)
 
 
-def generate_markdown(
+def _iter_file_block(
+    file_data: ProcessedFileData, lang_map: dict[str, str]
+) -> Iterator[str]:
+    """
+    Yields the Markdown section for a single processed file as flat tokens.
+
+    Yielding the header, fences, and content as separate chunks means the
+    file's content string is passed through untouched instead of being
+    copied into an intermediate per-block string.
+    """
+    relative_path_str = (
+        file_data.relative_path_posix or file_data.relative_path.as_posix()
+    )
+    yield f"## File: `{relative_path_str}`\n"
+
+    if file_data.status == "text_content" and file_data.content is not None:
+        if not file_data.content.strip():
+            yield "\n_(File is empty)_"
+        else:
+            # The workers resolve the language during processing; the map
+            # lookup here is only a fallback for results built elsewhere.
+            lang_hint = file_data.language or _get_language_hint(
+                file_data.path, lang_map
+            )
+            fence = _get_dynamic_fence(file_data.content)
+            yield f"\n{fence}{lang_hint}\n"
+            yield file_data.content
+            # Content is no longer stripped of its trailing newline during
+            # decoding, so only add one when the content doesn't end the
+            # line itself — otherwise the fence gains a blank line above it.
+            yield fence if file_data.content.endswith("\n") else f"\n{fence}"
+    elif file_data.status == "binary_file":
+        yield (
+            f"\n`[INFO] Binary file detected at '{relative_path_str}'. "
+            "Content not included.`"
+        )
+    elif file_data.status in ["read_error", "skipped_access_error"]:
+        error_msg = file_data.error_message or "An unknown error occurred."
+        yield (
+            f"\n`[WARNING] Could not process file '{relative_path_str}'. "
+            f"Error: {error_msg}`"
+        )
+
+
+def iter_markdown(
     processed_files: List[ProcessedFileData],
     project_root_path: Path,
-    config: dict[str, Any],
-) -> str:
+    config: Mapping[str, Any],
+    release_content: bool = False,
+) -> Iterator[str]:
     """
-    Generates a single Markdown string from a list of processed files.
+    Yields the Markdown document as a stream of string chunks.
 
     Each file is rendered as a distinct section with a header and either a
-    fenced code block or an informational message about its status.
+    fenced code block or an informational message about its status. Sections
+    are yielded as flat tokens — file content passes through as-is, never
+    copied into an intermediate per-section string — so callers can stream
+    straight to disk with peak memory independent of total output size.
+
+    With `release_content`, each file's content is dropped as soon as its
+    section has been rendered, letting the memory be reclaimed while the
+    rest of the document streams out. Only enable this when the results are
+    not needed afterwards.
     """
-    main_parts: List[str] = []
     lang_map = config.get("language_hints", {})
+    wrote_header = config.get("generate_header", True)
 
-    if config.get("generate_header", True):
+    if wrote_header:
         project_path_str = project_root_path.as_posix()
-        main_parts.append(f"# Codecat: Aggregated Code for '{project_root_path.name}'")
-        main_parts.append(
+        yield f"# Codecat: Aggregated Code for '{project_root_path.name}'\n"
+        yield (
             f"Generated from `{len(processed_files)}` files found "
-            f"in `{project_path_str}`.\n"
+            f"in `{project_path_str}`."
         )
 
-    file_blocks: List[str] = []
+    first_block = True
     for file_data in processed_files:
-        block_parts: List[str] = []
-        relative_path_str = file_data.relative_path.as_posix()
-        block_parts.append(f"## File: `{relative_path_str}`\n")
-
-        if file_data.status == "text_content" and file_data.content is not None:
-            if not file_data.content.strip():
-                block_parts.append("_(File is empty)_")
-            else:
-                lang_hint = _get_language_hint(file_data.path, lang_map)
-                fence = _get_dynamic_fence(file_data.content)
-                block_parts.append(f"{fence}{lang_hint}\n{file_data.content}\n{fence}")
-        elif file_data.status == "binary_file":
-            block_parts.append(
-                f"`[INFO] Binary file detected at '{relative_path_str}'. "
-                "Content not included.`"
-            )
-        elif file_data.status in ["read_error", "skipped_access_error"]:
-            error_msg = file_data.error_message or "An unknown error occurred."
-            block_parts.append(
-                f"`[WARNING] Could not process file '{relative_path_str}'. "
-                f"Error: {error_msg}`"
-            )
+        if first_block:
+            if wrote_header:
+                yield "\n\n"
+            first_block = False
+        else:
+            yield "\n\n---\n\n"
+        yield from _iter_file_block(file_data, lang_map)
+        if release_content:
+            file_data.content = None
 
-        file_blocks.append("\n".join(block_parts))
+    # Ensure the final output ends with a single newline for POSIX compliance.
+    yield "\n"
 
-    if file_blocks:
-        main_parts.append("\n\n---\n\n".join(file_blocks))
 
-    # Ensure the final output ends with a single newline for POSIX compliance.
-    return "\n".join(main_parts).strip() + "\n"
+def generate_markdown(
+    processed_files: List[ProcessedFileData],
+    project_root_path: Path,
+    config: Mapping[str, Any],
+) -> str:
+    """
+    Generates a single Markdown string from a list of processed files.
+
+    Convenience wrapper around `iter_markdown` for callers that want the
+    whole document in memory.
+    """
+    return "".join(iter_markdown(processed_files, project_root_path, config))
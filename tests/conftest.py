@@ -11,6 +11,20 @@ import re
 
 import pytest
 
+from codecat.config import clear_config_cache
+
+# Compiled once at import so every test session and direct importer shares
+# it; re.ASCII keeps the engine on the fast byte-class path since ANSI
+# escape sequences are pure ASCII.
+_ANSI_ESCAPE_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])", re.ASCII)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config_cache():
+    """Clears the mtime-keyed config read cache so tests stay isolated."""
+    clear_config_cache()
+    yield
+
 
 @pytest.fixture(scope="session")
 def strip_ansi_codes():
@@ -18,9 +32,9 @@ def strip_ansi_codes():
     Returns a helper function to remove ANSI escape sequences from a string,
     which is useful for cleaning up terminal output for assertions.
     """
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+    sub = _ANSI_ESCAPE_RE.sub
 
     def _strip(text: str) -> str:
-        return ansi_escape.sub("", text)
+        return sub("", text)
 
     return _strip
@@ -101,7 +101,7 @@ def test_run_command_with_verbose_output_for_skipped_files(
 def test_run_command_handles_write_error(tmp_path: Path, mocker, strip_ansi_codes):
     """Ensures the `run` command handles I/O errors during output file writing."""
     (tmp_path / "test_file.py").write_text("pass")
-    mocker.patch("pathlib.Path.write_text", side_effect=IOError("Permission denied"))
+    mocker.patch("pathlib.Path.open", side_effect=IOError("Permission denied"))
 
     result = runner.invoke(app, ["run", str(tmp_path)])
     assert result.exit_code != 0
@@ -182,8 +182,10 @@ def test_run_verbose_shows_error_status(tmp_path: Path, mocker, strip_ansi_codes
 
 
 def test_scan_error_with_stop_on_error(tmp_path: Path, mocker, strip_ansi_codes):
-    """Covers the stop_on_error branch in _scan_project_files."""
-    mocker.patch("codecat.cli_app.scan_project", side_effect=RuntimeError("disk fail"))
+    """Covers the stop_on_error branch in the streaming scan path."""
+    mocker.patch(
+        "codecat.cli_app.iter_project_files", side_effect=RuntimeError("disk fail")
+    )
     mocker.patch(
         "codecat.cli_app.load_config",
         return_value=({"stop_on_error": True, "verbose": False}, None, None),
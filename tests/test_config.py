@@ -11,7 +11,17 @@ overrides, including handling various error conditions.
 import json
 from pathlib import Path
 
-from codecat.config import load_config
+from codecat.config import DEFAULT_CONFIG, load_config
+from codecat.constants import DEFAULT_OUTPUT_FILENAME
+
+
+def test_default_output_filename_matches_constant():
+    """Ensures the shipped default config and the constant cannot drift.
+
+    The default output filename lives in default_config.json, but the
+    constant is what docs and tooling reference.
+    """
+    assert DEFAULT_CONFIG["output_file"] == DEFAULT_OUTPUT_FILENAME
 
 
 def test_loading_with_no_user_config(tmp_path: Path):
